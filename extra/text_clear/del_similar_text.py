@@ -1,10 +1,85 @@
 import argparse
 import logging
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
+from functools import partial
 from pathlib import Path
 from typing import List, Tuple
 
+# rapidfuzz is the fast path; without it scoring falls back to difflib
+# with cheap upper-bound prefilters.
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# google-re2 compiles to a DFA and scans in linear time with no
+# backtracking, which suits the removal patterns built here (escaped
+# literals joined by '|'). Lookaround and backreferences are not
+# supported by re2, so patterns using them fall back to the stdlib
+# engine.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Compiled once at import; extract_sentences runs once per file.
+# Consumes up to the terminating punctuation rather than using a
+# lookbehind split, which keeps the regex engine on its fast path.
+_SENT_RE = re.compile(r'\s*([^.!?]+[.!?]+)')
+
+# Below this many files the process-pool startup cost outweighs the win.
+_MIN_FILES_FOR_POOL = 8
+
+
+def _staged_ratio(a: str, b: str, threshold: float) -> float:
+    """
+    difflib ratio guarded by its O(1)/O(n) upper bounds: pairs that
+    cannot reach the threshold are rejected before the O(n*m) ratio call.
+    """
+    # Length alone bounds the ratio at 2*min/(len_a+len_b); reject before
+    # even constructing the matcher.
+    len_a, len_b = len(a), len(b)
+    upper = 2 * min(len_a, len_b) / (len_a + len_b) if (len_a + len_b) else 0.0
+    if upper < threshold:
+        return 0.0
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() < threshold:
+        return 0.0
+    if matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
+
+
+def _score_file(file: Path, query: str, threshold: float) -> List[Tuple[Path, str, float]]:
+    """
+    Read one file, split it into sentences, and score them against the
+    query. Module-level so it can be pickled into worker processes.
+    """
+    text = file.read_text(encoding="utf-8", errors="ignore")
+    sentences = FullTextSearchRemover.extract_sentences(text)
+    if not sentences:
+        return []
+    if process is not None:
+        scores = process.cdist(
+            [query], sentences,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+        )[0]
+        return [
+            (file, sentences[i], scores[i] / 100)
+            for i in np.nonzero(scores)[0]
+        ]
+    matches = []
+    for sentence in sentences:
+        score = _staged_ratio(query, sentence, threshold)
+        if score >= threshold:
+            matches.append((file, sentence, score))
+    return matches
+
 
 class FullTextSearchRemover:
     """
@@ -31,29 +106,32 @@ class FullTextSearchRemover:
         """
         Split text into sentences using punctuation delimiters.
         """
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [s for s in (m.group(1).strip() for m in _SENT_RE.finditer(text)) if s]
 
-    @staticmethod
-    def similarity(a: str, b: str) -> float:
+    def similarity(self, a: str, b: str) -> float:
         """
-        Compute a similarity ratio between two strings.
+        Compute a similarity ratio between two strings, short-circuiting
+        pairs that cannot reach the configured threshold.
         """
-        return SequenceMatcher(None, a, b).ratio()
+        return _staged_ratio(a, b, self.threshold)
 
-    def search(self, query: str, top_n: int = 25) -> List[Tuple[Path, str, float]]:
+    def search(self, query: str, top_n: int | None = 25) -> List[Tuple[Path, str, float]]:
         """
         Search all text files for sentences matching the query via similarity.
-        Returns top_n matches as tuples of (file_path, sentence, score).
-        """
-        matches: List[Tuple[Path, str, float]] = []
-        for file in self.text_files:
-            text = file.read_text(encoding="utf-8", errors="ignore")
-            sentences = self.extract_sentences(text)
-            for sentence in sentences:
-                score = self.similarity(query, sentence)
-                if score >= self.threshold:
-                    matches.append((file, sentence, score))
+        Files are scored independently, fanned out across worker processes
+        when the corpus is large enough to pay for the pool.
+        Returns top_n matches (all if None) as tuples of (file_path, sentence, score).
+        """
+        score = partial(_score_file, query=query, threshold=self.threshold)
+        if len(self.text_files) < _MIN_FILES_FOR_POOL:
+            per_file = map(score, self.text_files)
+            matches = [m for batch in per_file for m in batch]
+        else:
+            with ProcessPoolExecutor() as executor:
+                matches = [
+                    m for batch in executor.map(score, self.text_files)
+                    for m in batch
+                ]
         matches.sort(key=lambda x: x[2], reverse=True)
         return matches[:top_n]
 
@@ -65,18 +143,33 @@ class FullTextSearchRemover:
         top = self.search(query, top_n=1)
         return top[0] if top else None
 
+    @staticmethod
+    def _sub_in_file(regex: "re.Pattern[bytes]", file: Path) -> bool:
+        """
+        Apply a bytes regex substitution to a file via mmap, rewriting it
+        only when something matched. Returns True if the file changed.
+        """
+        if file.stat().st_size == 0:
+            return False
+        with open(file, "r+b") as handle:
+            with mmap.mmap(handle.fileno(), 0) as mm:
+                if not regex.search(mm):
+                    return False
+                new = regex.sub(b"", mm)
+            handle.seek(0)
+            handle.write(new)
+            handle.truncate()
+        return True
+
     def remove_sentence_from_all(self, sentence: str) -> bool:
         """
         Remove all exact occurrences of the given sentence from every text file.
         Returns True if any file was modified.
         """
-        escaped = re.escape(sentence)
+        regex = _re.compile(re.escape(sentence).encode("utf-8"))
         changed = False
         for file in self.text_files:
-            text = file.read_text(encoding="utf-8", errors="ignore")
-            new_text = re.sub(escaped, "", text)
-            if new_text != text:
-                file.write_text(new_text, encoding="utf-8")
+            if self._sub_in_file(regex, file):
                 logging.info(f"Removed sentence from {file}")
                 changed = True
         return changed
@@ -85,12 +178,13 @@ class FullTextSearchRemover:
         """
         Treat the query as a regex and remove all matches across text files.
         """
-        regex = re.compile(pattern)
+        try:
+            regex = _re.compile(pattern.encode("utf-8"))
+        except Exception:
+            # re2 rejects lookaround/backreferences; retry with stdlib re.
+            regex = re.compile(pattern.encode("utf-8"))
         for file in self.text_files:
-            text = file.read_text(encoding="utf-8", errors="ignore")
-            new_text = regex.sub('', text)
-            if new_text != text:
-                file.write_text(new_text, encoding="utf-8")
+            if self._sub_in_file(regex, file):
                 logging.info(f"Removed regex matches from {file}")
 
     def run(self, query: str) -> None:
@@ -102,16 +196,23 @@ class FullTextSearchRemover:
             self.remove_pattern_from_all(query)
         else:
             logging.info("Starting similarity removal mode.")
-            while True:
-                match = self.get_best_match(query)
-                if not match:
-                    logging.info("No more matches above threshold.")
-                    break
-                file, sentence, score = match
-                logging.info(f"Best match (score={score:.2f}) in {file}: '{sentence}'")
-                if not self.remove_sentence_from_all(sentence):
-                    logging.info("No removal occurred. Exiting loop.")
-                    break
+            matches = self.search(query, top_n=None)
+            if not matches:
+                logging.info("No matches above threshold.")
+            sentences_by_file: dict[Path, set] = {}
+            for file, sentence, score in matches:
+                logging.info(f"Match (score={score:.2f}) in {file}: '{sentence}'")
+                sentences_by_file.setdefault(file, set()).add(sentence)
+            for file, sentences in sentences_by_file.items():
+                # Longest-first so short matches cannot shadow longer ones.
+                pattern = _re.compile(
+                    "|".join(map(re.escape, sorted(sentences, key=len, reverse=True)))
+                )
+                text = file.read_text(encoding="utf-8", errors="ignore")
+                new_text = pattern.sub("", text)
+                if new_text != text:
+                    file.write_text(new_text, encoding="utf-8")
+                    logging.info(f"Removed {len(sentences)} sentence(s) from {file}")
         logging.info("Removal complete.")
 
 
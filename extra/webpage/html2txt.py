@@ -4,11 +4,25 @@ A clean, class-based utility to convert an HTML file into a plain-text (.txt) fi
 
 import argparse
 import logging
+import re
 from pathlib import Path
 from typing import Optional
 
 from bs4 import BeautifulSoup
 
+# Prefer the C-backed lxml parser; fall back to the stdlib one when
+# lxml is not installed.
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+# Whitespace cleanup done in two C-level passes: strip leading/trailing
+# blanks on each line, then collapse runs of blank lines to one newline.
+_LINE_STRIP = re.compile(r'^[ \t]+|[ \t]+$', re.M)
+_WS_RE = re.compile(r'\s*\n\s*')
+
 
 class HtmlToTextConverter:
     """
@@ -35,11 +49,9 @@ class HtmlToTextConverter:
 
     def extract_text(self, html: str) -> str:
         """Extract visible text from HTML, collapse extra whitespace."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _BS_PARSER)
         raw_text = soup.get_text(separator='\n')
-        lines = (line.strip() for line in raw_text.splitlines())
-        filtered = [line for line in lines if line]
-        result = '\n'.join(filtered)
+        result = _WS_RE.sub('\n', _LINE_STRIP.sub('', raw_text)).strip()
         logging.debug("Extracted and cleaned text.")
         return result
 
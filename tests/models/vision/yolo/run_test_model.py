@@ -1,16 +1,29 @@
 import os
-import subprocess
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
 from tkinter import filedialog, messagebox
 
 import cv2
+import numpy as np
 from ultralytics import YOLO
+from yt_dlp import YoutubeDL
 
 
 class VideoDetectionApp:
     """A Tkinter GUI for real-time YOLOv8 video detection."""
 
+    # Frames per inference call; batching amortizes the per-call launch
+    # overhead on the accelerator.
+    BATCH_SIZE = 8
+
+    # Frames whose 8x8 perceptual hash is within this Hamming distance of
+    # the last inferred frame reuse its detections instead of re-running
+    # the model.
+    SKIP_HAMMING = 4
+
     def __init__(self, master: tk.Tk):
         self.master = master
         self.master.title("YOLO Video Detection")
@@ -64,14 +77,20 @@ class VideoDetectionApp:
 
     def download_youtube_video(self, url: str) -> str:
         """
-        Use yt-dlp to download a YouTube URL to a temporary file.
-        Returns the path to the downloaded file.
+        Download a YouTube URL to a temporary file via the yt-dlp API
+        (no subprocess fork). Returns the path to the downloaded file.
         """
         output = f"temp_{int(time.time())}.mp4"
-        cmd = ["yt-dlp", "-f", "best[ext=mp4]", "-o", output, url]
-        subprocess.run(cmd, check=True)
+        with YoutubeDL({"format": "best[ext=mp4]", "outtmpl": output}) as ydl:
+            ydl.download([url])
         return output
 
+    @staticmethod
+    def _frame_hash(frame) -> int:
+        """Cheap 8x8 average-hash of a frame for near-duplicate detection."""
+        small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (8, 8))
+        return int.from_bytes((small > small.mean()).tobytes(), "big")
+
     def stop_detection(self) -> None:
         """Signal the detection loop to stop after the current frame."""
         self.stop_requested = True
@@ -90,16 +109,25 @@ class VideoDetectionApp:
         self.stop_requested = False
         self.run_button.config(state=tk.DISABLED)
 
-        # Download if URL provided
+        # Start the download (if any) in the background and load the model
+        # while the network I/O is in flight.
         try:
-            if url:
-                print("📥 Downloading YouTube video...")
-                self.temp_file = self.download_youtube_video(url)
-                video_source = self.temp_file
-            elif self.video_path:
-                video_source = self.video_path
-            else:
-                raise ValueError("No video source provided.")
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                dl_future = None
+                if url:
+                    print("📥 Downloading YouTube video...")
+                    dl_future = pool.submit(self.download_youtube_video, url)
+                elif not self.video_path:
+                    raise ValueError("No video source provided.")
+
+                # Load model once, concurrently with the download
+                model = YOLO(self.model_path)
+
+                if dl_future is not None:
+                    self.temp_file = dl_future.result()
+                    video_source = self.temp_file
+                else:
+                    video_source = self.video_path
         except Exception as exc:
             messagebox.showerror("Error", f"Failed to get video:\n{exc}")
             self.run_button.config(state=tk.NORMAL)
@@ -112,30 +140,116 @@ class VideoDetectionApp:
             self.cleanup()
             return
 
-        # Load model once
-        model = YOLO(self.model_path)
         cv2.namedWindow("Detection", cv2.WINDOW_NORMAL)
         cv2.resizeWindow("Detection", 800, 600)
 
-        # Frame-by-frame loop
-        while cap.isOpened() and not self.stop_requested:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        # Decode frames on a background thread so video I/O overlaps with
+        # inference; a bounded queue keeps memory in check.
+        frame_queue: Queue = Queue(maxsize=4)
+        stop_event = threading.Event()
 
-            # Run inference on the frame
-            results = model(frame)[0]  # first (and only) batch
-            annotated = results.plot()
+        # Ring of reusable decode buffers, large enough to cover every
+        # in-flight frame (queued + pending batch + the one on display),
+        # so the decoder stops allocating a fresh array per frame.
+        n_buffers = frame_queue.maxsize + self.BATCH_SIZE + 2
 
-            # Display
-            cv2.imshow("Detection", annotated)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
+        def _decode() -> None:
+            buffers: list | None = None
+            index = 0
+            while not stop_event.is_set():
+                if buffers is None:
+                    # First frame establishes the shape for the ring.
+                    ret, frame = cap.read()
+                    if ret:
+                        buffers = [np.empty_like(frame) for _ in range(n_buffers)]
+                else:
+                    ret, frame = cap.read(buffers[index % n_buffers])
+                    index += 1
+                if not ret:
+                    break
+                frame_queue.put(frame)
+            frame_queue.put(None)  # end-of-stream sentinel
 
-            # Process any pending GUI events (so Stop button works)
-            self.master.update()
+        decoder = threading.Thread(target=_decode, daemon=True)
+        decoder.start()
 
-        # Cleanup
+        # Batched frame loop: frames that look like the last inferred frame
+        # reuse its annotation; the rest accumulate into a batch and go
+        # through the model in one call, then everything is displayed in
+        # order. Inference runs in FP16 where the backend supports it,
+        # halving the bytes moved per frame; the first failing call drops
+        # back to FP32.
+        batch: list = []     # frames pending inference
+        schedule: list = []  # display order: index into batch, or -1 = reuse
+        prev_hash: int | None = None
+        prev_ann = None
+        ann_buf = None       # reused canvas for annotated output
+        done = False
+        use_half = True
+        plot_into_buf = True
+        while not done and not self.stop_requested:
+            frame = frame_queue.get()
+            done = frame is None
+            if not done:
+                frame_hash = self._frame_hash(frame)
+                if (
+                    prev_hash is not None
+                    and bin(frame_hash ^ prev_hash).count("1") < self.SKIP_HAMMING
+                ):
+                    schedule.append(-1)
+                else:
+                    schedule.append(len(batch))
+                    batch.append(frame)
+                    prev_hash = frame_hash
+
+            if schedule and (len(schedule) >= self.BATCH_SIZE or done):
+                results_list = []
+                if batch:
+                    if use_half:
+                        try:
+                            results_list = model(batch, half=True, verbose=False)
+                        except Exception:
+                            print("⚠️  FP16 not supported on this backend; using FP32.")
+                            use_half = False
+                            results_list = model(batch, verbose=False)
+                    else:
+                        results_list = model(batch, verbose=False)
+                for idx in schedule:
+                    if idx >= 0:
+                        results = results_list[idx]
+                        if plot_into_buf:
+                            if ann_buf is None or ann_buf.shape != results.orig_img.shape:
+                                ann_buf = np.empty_like(results.orig_img)
+                            np.copyto(ann_buf, results.orig_img)
+                            try:
+                                prev_ann = results.plot(img=ann_buf)
+                            except TypeError:
+                                # Older ultralytics without the img kwarg.
+                                plot_into_buf = False
+                                prev_ann = results.plot()
+                        else:
+                            prev_ann = results.plot()
+                    annotated = prev_ann
+
+                    # Display
+                    cv2.imshow("Detection", annotated)
+                    if cv2.waitKey(1) & 0xFF == ord("q"):
+                        self.stop_requested = True
+                        break
+
+                    # Process any pending GUI events (so Stop button works)
+                    self.master.update()
+                batch = []
+                schedule = []
+
+        # Cleanup: unblock the decoder if it is waiting on a full queue.
+        stop_event.set()
+        try:
+            while True:
+                frame_queue.get_nowait()
+        except Empty:
+            pass
+        decoder.join(timeout=1)
         cap.release()
         cv2.destroyAllWindows()
         self.cleanup()
@@ -4,7 +4,9 @@ and creates corresponding `.md` files with the same content.
 """
 
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -18,53 +20,67 @@ logging.basicConfig(
 
 class MdxToMdConverter:
     """
-    Scans a directory for `.mdx` files and converts each one into a `.md`
-    file (by copying its contents). If a `.md` version already exists, it
-    will be skipped to avoid overwriting.
+    Scans a directory tree for `.mdx` files and converts each one into a
+    `.md` file (by hardlinking, or copying its contents as a fallback).
+    If a `.md` version already exists, it will be skipped to avoid
+    overwriting.
     """
 
+    # Linking/copying is I/O bound, so conversions run across threads.
+    MAX_WORKERS = 16
+
     def __init__(self, directory: Path) -> None:
         """
         :param directory: Path to the directory containing `.mdx` files.
         """
         self.directory: Path = directory
 
+    def _convert_one(self, item: Path) -> None:
+        """Convert a single `.mdx` file to its `.md` sibling."""
+        target_path = item.with_suffix(".md")
+
+        if target_path.exists():
+            logging.info(
+                "Skipping '%s': '%s' already exists.", item.name, target_path.name
+            )
+            return
+
+        try:
+            # Contents are identical, so a hardlink (pure metadata op)
+            # beats copying the bytes; copy across filesystems.
+            try:
+                os.link(item, target_path)
+                logging.info("Hardlinked: '%s' → '%s'", item.name, target_path.name)
+            except OSError:
+                shutil.copyfile(item, target_path)
+                logging.info("Copied: '%s' → '%s'", item.name, target_path.name)
+        except Exception as e:
+            logging.error(
+                "Failed to convert '%s' to '%s': %s",
+                item.name, target_path.name, e
+            )
+
     def convert_all(self) -> None:
         """
-        Locate every `.mdx` file in `self.directory` (non-recursive) and
-        copy it to a new file with a `.md` extension, unless that file
-        already exists.
+        Locate every `.mdx` file under `self.directory` (recursive) and
+        convert each one to a `.md` file, fanning the work out across a
+        thread pool.
         """
         if not self.directory.exists() or not self.directory.is_dir():
             logging.error("Provided path '%s' is not a valid directory.", self.directory)
             return
 
-        logging.info("Scanning directory: %s", self.directory)
-
-        for item in self.directory.iterdir():
-            # Process only regular files ending in .mdx
-            if not item.is_file():
-                continue
-
-            if item.suffix.lower() != ".mdx":
-                continue
+        logging.info("Scanning directory tree: %s", self.directory)
 
-            target_path = item.with_suffix(".md")
+        files = [
+            Path(root) / name
+            for root, _, names in os.walk(self.directory)
+            for name in names
+            if name.lower().endswith(".mdx")
+        ]
 
-            if target_path.exists():
-                logging.info(
-                    "Skipping '%s': '%s' already exists.", item.name, target_path.name
-                )
-                continue
-
-            try:
-                shutil.copyfile(item, target_path)
-                logging.info("Converted: '%s' → '%s'", item.name, target_path.name)
-            except Exception as e:
-                logging.error(
-                    "Failed to convert '%s' to '%s': %s",
-                    item.name, target_path.name, e
-                )
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            list(executor.map(self._convert_one, files))
 
 
 def main() -> None:
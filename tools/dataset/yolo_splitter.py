@@ -1,11 +1,16 @@
+import os
 import shutil
 import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
 
 class YoloDatasetSplitter:
-    IMAGE_EXTS = ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.tif', '*.tiff']
+    IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'}
+
+    # Bulk copy/move is I/O bound, so a generous thread count pays off.
+    MAX_IO_WORKERS = 32
 
     def __init__(self,
                  base_path: str,
@@ -45,6 +50,25 @@ class YoloDatasetSplitter:
             } for split in self.dest_splits
         }
 
+    def _run_file_ops(self, ops: List[Tuple[Path, Path, str]]):
+        """Run (src, dst, 'copy'|'link'|'move') file operations across threads."""
+        def _do(op: Tuple[Path, Path, str]):
+            src, dst, kind = op
+            if kind == 'link':
+                # Hardlink is a pure metadata op; fall back to a real copy
+                # across filesystems.
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy(str(src), str(dst))
+            elif kind == 'copy':
+                shutil.copy(str(src), str(dst))
+            else:
+                shutil.move(str(src), str(dst))
+
+        with ThreadPoolExecutor(max_workers=self.MAX_IO_WORKERS) as ex:
+            list(ex.map(_do, ops))
+
     def _make_folder(self, path: Path):
         if path.exists():
             shutil.rmtree(path)
@@ -56,16 +80,23 @@ class YoloDatasetSplitter:
         - Moves unmatched into issue_files/.
         - Returns only the matched (img, lbl) pairs.
         """
-        # collect all image paths and label paths
+        # collect all image paths and label paths — one scandir pass per
+        # directory instead of one glob per extension
         img_paths = []
         lbl_paths = []
         for split, dirs in self.src_dirs.items():
             img_dir, lbl_dir = dirs['images'], dirs['labels']
             if img_dir.is_dir():
-                for ext in self.IMAGE_EXTS:
-                    img_paths += list(img_dir.glob(ext))
+                img_paths += [
+                    Path(entry.path) for entry in os.scandir(img_dir)
+                    if entry.is_file()
+                    and Path(entry.name).suffix.lower() in self.IMAGE_SUFFIXES
+                ]
             if lbl_dir.is_dir():
-                lbl_paths += list(lbl_dir.glob('*.txt'))
+                lbl_paths += [
+                    Path(entry.path) for entry in os.scandir(lbl_dir)
+                    if entry.is_file() and entry.name.endswith('.txt')
+                ]
 
         # map stem -> path
         imgs_by_stem = {p.stem: p for p in img_paths}
@@ -94,12 +125,14 @@ class YoloDatasetSplitter:
         return pairs
 
     def combine_all(self, pairs: List[Tuple[Path, Path]]):
-        """Copy matched pairs into all/images + all/labels."""
+        """Hardlink (copy across filesystems) matched pairs into all/."""
         self._make_folder(self.all_images)
         self._make_folder(self.all_labels)
+        ops: List[Tuple[Path, Path, str]] = []
         for img_p, lbl_p in pairs:
-            shutil.copy(img_p, self.all_images / img_p.name)
-            shutil.copy(lbl_p, self.all_labels / lbl_p.name)
+            ops.append((img_p, self.all_images / img_p.name, 'link'))
+            ops.append((lbl_p, self.all_labels / lbl_p.name, 'link'))
+        self._run_file_ops(ops)
 
     def remove_old_splits(self):
         """Delete original train/, valid/, test/ directories."""
@@ -130,6 +163,7 @@ class YoloDatasetSplitter:
             self._make_folder(self.dest_dirs[split]['labels'])
 
         # move files
+        ops: List[Tuple[Path, Path, str]] = []
         for split, imgs in splits.items():
             for img_p in imgs:
                 stem = img_p.stem
@@ -137,11 +171,12 @@ class YoloDatasetSplitter:
                 dst_img = self.dest_dirs[split]['images'] / img_p.name
                 dst_lbl = self.dest_dirs[split]['labels'] / lbl_p.name
 
-                shutil.move(str(img_p), dst_img)
+                ops.append((img_p, dst_img, 'move'))
                 if lbl_p.exists():
-                    shutil.move(str(lbl_p), dst_lbl)
+                    ops.append((lbl_p, dst_lbl, 'move'))
                 else:
                     print(f"⚠️  Missing label for {img_p.name} during split.")
+        self._run_file_ops(ops)
 
     def clean_all_folder(self):
         """Remove the temporary 'all' folder after splitting."""